@@ -4,6 +4,7 @@ from agentgate.client import AgentGateClient, AgentGateClientSync
 from agentgate.errors import AgentGateError
 from agentgate.types import (
     ApprovalRequest,
+    BackoffStrategy,
     Decision,
     DecisionResult,
     FallbackBehavior,
@@ -16,6 +17,7 @@ __all__ = [
     "AgentGateClientSync",
     "AgentGateError",
     "ApprovalRequest",
+    "BackoffStrategy",
     "Decision",
     "DecisionResult",
     "FallbackBehavior",
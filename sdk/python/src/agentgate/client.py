@@ -11,18 +11,38 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import atexit
+import copy
+import functools
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import random
+import threading
+import time
+import warnings
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import httpx
 except ImportError:
     raise ImportError("httpx is required. Install with: pip install agentgate-sdk")
 
+try:
+    import orjson
+except ImportError:  # optional: pip install agentgate-sdk[fast]
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # optional: pip install agentgate-sdk[uvloop]
+    uvloop = None  # type: ignore[assignment]
+
 from agentgate.errors import AgentGateError
 from agentgate.types import (
     ApprovalRequest,
+    BackoffStrategy,
     DecisionResult,
     FallbackBehavior,
     Policy,
@@ -33,9 +53,180 @@ logger = logging.getLogger("agentgate.client")
 
 _DEFAULT_URL = "http://localhost:3000"
 _DEFAULT_TIMEOUT = 10.0
-_RETRY_BACKOFFS = [0.5, 1.0, 2.0]
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 8.0
 _RETRYABLE_STATUS = {500, 502, 503, 504}
-_CLIENT_ERROR_STATUS = {400, 401, 403}
+# Maps both Urgency members and their plain-string values to the wire value.
+_URGENCY_VALUES: Dict[Any, str] = {u: u.value for u in Urgency}
+
+# orjson encodes/decodes bodies several times faster than the stdlib module.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a request body to compact JSON bytes."""
+    if orjson is not None:
+        # Stringify non-str keys like the stdlib encoder does.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Process-wide HTTP clients handed out by AgentGateClient.shared(). Pooled
+# connections belong to the event loop that opened them, so clients are kept
+# per loop and keyed by (url, api_key, timeout) within it.
+_SHARED_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[Tuple[str, str, float], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+_POOL_OPTIONS = ("max_connections", "max_keepalive_connections", "keepalive_expiry", "http2")
+
+
+def _shared_http(key: Tuple[str, str, float], pool_options: Dict[str, Any]) -> httpx.AsyncClient:
+    """Return the shared HTTP client for ``key`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _SHARED_LOCK:
+        clients = _SHARED_CLIENTS.setdefault(loop, {})
+        http = clients.get(key)
+        if http is None or http.is_closed:
+            http = clients[key] = _build_http(*key, **pool_options)
+    return http
+
+
+async def _aclose_all(clients: List[httpx.AsyncClient]) -> None:
+    # Best effort: one failing client must not keep the others open.
+    await asyncio.gather(*(http.aclose() for http in clients), return_exceptions=True)
+
+
+def _close_shared_clients() -> None:
+    """Close shared HTTP clients at interpreter exit.
+
+    Each client is closed on its own loop. Clients whose loop has already
+    been closed lost their connections with it and are skipped.
+    """
+    with _SHARED_LOCK:
+        per_loop = [(loop, list(clients.values())) for loop, clients in _SHARED_CLIENTS.items()]
+        _SHARED_CLIENTS.clear()
+
+    for loop, clients in per_loop:
+        if not clients or loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(_aclose_all(clients), loop).result(timeout=5.0)
+            else:
+                loop.run_until_complete(_aclose_all(clients))
+        except Exception:  # pragma: no cover - best effort at shutdown
+            logger.debug("Failed to close shared AgentGate HTTP clients", exc_info=True)
+
+
+atexit.register(_close_shared_clients)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_env_config() -> Tuple[str, str, float]:
+    """Read ``(url, api_key, timeout)`` defaults from env vars, once per process."""
+    url = os.environ.get("AGENTGATE_URL", _DEFAULT_URL).rstrip("/")
+    api_key = os.environ.get("AGENTGATE_API_KEY", "")
+    raw_timeout = os.environ.get("AGENTGATE_TIMEOUT")
+    timeout = float(raw_timeout) if raw_timeout is not None else _DEFAULT_TIMEOUT
+    return url, api_key, timeout
+
+
+def clear_env_cache() -> None:
+    """Forget cached ``AGENTGATE_*`` env values so the next client re-reads them."""
+    _resolve_env_config.cache_clear()
+
+
+def _resolve_config(
+    url: Optional[str],
+    api_key: Optional[str],
+    timeout: Optional[float],
+) -> Tuple[str, str, float]:
+    """Resolve ``(url, api_key, timeout)`` from explicit args and env vars."""
+    env_url, env_key, env_timeout = _resolve_env_config()
+    return (
+        url.rstrip("/") if url else env_url,
+        api_key or env_key,
+        float(timeout) if timeout is not None else env_timeout,
+    )
+
+
+def _build_http(
+    url: str,
+    api_key: str,
+    timeout: float,
+    *,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 5.0,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """Build the pooled ``httpx.AsyncClient`` used by :class:`AgentGateClient`.
+
+    No custom transport is passed, so httpx keeps honouring ``HTTP(S)_PROXY`` /
+    ``ALL_PROXY`` / ``NO_PROXY`` from the environment.
+    """
+    headers: Dict[str, str] = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    return httpx.AsyncClient(
+        base_url=url,
+        headers=headers,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+    )
+
+
+def _backoff_schedule(max_retries: int, strategy: BackoffStrategy) -> Tuple[float, ...]:
+    """Precompute the delay before each retry.
+
+    Delays double from ``_BACKOFF_BASE`` up to ``_BACKOFF_CAP``. With
+    ``JITTER`` each delay is scaled by a random factor in [0.5, 1.5) so that
+    clients recovering from the same outage do not retry in lockstep.
+    """
+    delays = [min(_BACKOFF_CAP, _BACKOFF_BASE * 2**i) for i in range(max_retries)]
+    if strategy == BackoffStrategy.JITTER:
+        return tuple(d * (0.5 + random.random()) for d in delays)
+    return tuple(delays)
+
+
+def _decode(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, raising AgentGateError if it is malformed.
+
+    Malformed bodies are server bugs rather than outages, so the error is not
+    flagged as a connectivity error and does not trigger the fallback.
+    """
+    try:
+        return _loads(resp.content)
+    # JSONDecodeError (orjson's included) and UnicodeDecodeError are ValueErrors.
+    except ValueError as exc:
+        raise AgentGateError(
+            f"Invalid JSON in HTTP {resp.status_code} response: {exc}",
+            status_code=resp.status_code,
+        ) from exc
+
+
+def _extract_error(data: Any) -> Dict[str, Any]:
+    """Return the ``error`` object from an API error body, or ``{}``."""
+    error_info = data.get("error") if isinstance(data, dict) else None
+    return error_info if isinstance(error_info, dict) else {}
+
+
+def _api_error(status_code: int, data: Any) -> AgentGateError:
+    """Build an :class:`AgentGateError` from an HTTP error response."""
+    error_info = _extract_error(data)
+    return AgentGateError(
+        error_info.get("message", f"HTTP {status_code}"),
+        status_code=status_code,
+        error_type=error_info.get("type"),
+        response_data=data,
+    )
 
 
 class AgentGateClient:
@@ -43,10 +234,31 @@ class AgentGateClient:
 
     Parameters:
         url: Base URL. Defaults to ``AGENTGATE_URL`` env var or ``http://localhost:3000``.
+            Env vars are read once per process; call :func:`clear_env_cache`
+            after changing them.
         api_key: API key for Bearer auth. Defaults to ``AGENTGATE_API_KEY`` env var.
         timeout: Request timeout in seconds. Defaults to ``AGENTGATE_TIMEOUT`` env var or 10.
         fallback: Behavior when server is unreachable: ``"deny"`` (default) or ``"allow"``.
-        max_retries: Max retry attempts on 5xx/connection errors (default 3).
+        max_retries: Max retry attempts on 5xx/connection errors/timeouts (default 3).
+        backoff_strategy: ``"jitter"`` (default) for exponential backoff with
+            random jitter, or ``"fixed"`` for a deterministic 0.5s, 1s, 2s, ... schedule.
+        max_connections: Max concurrent connections in the pool (default 100).
+        max_keepalive_connections: Max idle connections kept alive (default 20).
+        keepalive_expiry: Seconds an idle connection is kept alive (default 5).
+        http2: Negotiate HTTP/2 when the server supports it (default True).
+        max_concurrency: Max in-flight requests for batch helpers such as
+            :meth:`check_decisions` (default 16).
+        policy_cache_ttl: Seconds :meth:`list_policies` results are cached
+            (default 30). Use 0 to disable the cache.
+        include_raw: Keep the decoded response body on ``ApprovalRequest.raw`` and
+            ``Policy.raw`` (default True). Pass False to avoid retaining it. The
+            default will change to False in a future release; leaving it unset
+            emits a ``FutureWarning``.
+
+    A single client is safe to share across tasks and is the intended fast
+    path: concurrent calls multiplex over the same pooled connections instead
+    of paying a fresh TCP/TLS handshake per client. For thousands of
+    concurrent approval checks, run your event loop on uvloop.
     """
 
     def __init__(
@@ -56,24 +268,88 @@ class AgentGateClient:
         timeout: Optional[float] = None,
         fallback: FallbackBehavior | str = FallbackBehavior.DENY,
         max_retries: int = 3,
+        backoff_strategy: BackoffStrategy | str = BackoffStrategy.JITTER,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http2: bool = True,
+        max_concurrency: int = 16,
+        policy_cache_ttl: float = 30.0,
+        include_raw: Optional[bool] = None,
+        _shared_pool: Optional[Tuple[Tuple[str, str, float], Dict[str, Any]]] = None,
     ) -> None:
-        self._url = (url or os.environ.get("AGENTGATE_URL", _DEFAULT_URL)).rstrip("/")
-        self._api_key = api_key or os.environ.get("AGENTGATE_API_KEY", "")
-        raw_timeout = timeout if timeout is not None else os.environ.get("AGENTGATE_TIMEOUT")
-        self._timeout = float(raw_timeout) if raw_timeout is not None else _DEFAULT_TIMEOUT
-        self._fallback = FallbackBehavior(fallback) if isinstance(fallback, str) else fallback
-        self._max_retries = max_retries
-
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self._api_key:
-            headers["Authorization"] = f"Bearer {self._api_key}"
-
-        self._http = httpx.AsyncClient(
-            base_url=self._url,
-            headers=headers,
-            timeout=self._timeout,
+        self._url, self._api_key, self._timeout = _resolve_config(url, api_key, timeout)
+        self._fallback = FallbackBehavior(fallback)
+        if self._fallback == FallbackBehavior.ALLOW:
+            self._fallback_status = self._fallback_decision = "approved"
+        else:
+            self._fallback_status = self._fallback_decision = "denied"
+        self._backoffs = _backoff_schedule(max_retries, BackoffStrategy(backoff_strategy))
+        self._max_concurrency = max_concurrency
+        if include_raw is None:
+            warnings.warn(
+                "include_raw will default to False in a future release; pass "
+                "include_raw=True to keep the response body on .raw, or "
+                "include_raw=False to drop it",
+                FutureWarning,
+                stacklevel=2,
+            )
+            include_raw = True
+        self._include_raw = include_raw
+        self._policy_cache_ttl = policy_cache_ttl
+        # (fetched_at, etag, policies). asyncio locks bind to one event loop,
+        # so refreshes are serialised by a lock per loop (see ``shared``).
+        self._policy_cache: Optional[Tuple[float, Optional[str], List[Policy]]] = None
+        self._policy_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
         )
 
+        # Shared clients (see ``shared``) resolve their HTTP client per event
+        # loop on each call instead of owning one.
+        self._shared_pool = _shared_pool
+        if _shared_pool is None:
+            self._http_client = _build_http(
+                self._url,
+                self._api_key,
+                self._timeout,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
+
+    @classmethod
+    def shared(
+        cls,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> "AgentGateClient":
+        """Return a client backed by a process-wide shared connection pool.
+
+        Clients created with the same ``url``, ``api_key`` and ``timeout`` reuse
+        one underlying ``httpx.AsyncClient`` per event loop, so repeated
+        instantiation (e.g. several libraries in one process) does not pay a
+        new TCP/TLS handshake. The pool is looked up on each call, so a shared
+        client also works across separate ``asyncio.run`` calls. Pool options
+        (``max_connections``, ``http2``, ...) only apply when a loop's shared
+        pool is first created; other ``kwargs`` such as ``max_retries`` are
+        per client and always honoured, since retries happen in the client.
+        :meth:`close` leaves the shared pool open; it is closed at interpreter
+        exit.
+        """
+        key = _resolve_config(url, api_key, timeout)
+        pool_options = {name: kwargs.pop(name) for name in _POOL_OPTIONS if name in kwargs}
+        return cls(*key, _shared_pool=(key, pool_options), **kwargs)
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """The HTTP client to use: owned, or the shared one for the running loop."""
+        if self._shared_pool is not None:
+            return _shared_http(*self._shared_pool)
+        return self._http_client
+
     async def __aenter__(self) -> "AgentGateClient":
         return self
 
@@ -81,8 +357,26 @@ class AgentGateClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self._http.aclose()
+        """Close the underlying HTTP client (shared clients are left open)."""
+        if self._shared_pool is None:
+            await self._http_client.aclose()
+
+    async def warmup(self) -> bool:
+        """Open a pooled connection ahead of the first real request.
+
+        Sends ``GET /health`` so the TCP/TLS (and HTTP/2) handshake overlaps
+        with agent start-up instead of delaying the first approval check.
+        Errors are swallowed.
+
+        Returns:
+            True if the server answered, False otherwise.
+        """
+        try:
+            await self._http.get("/health", timeout=2.0)
+        except httpx.HTTPError as exc:
+            logger.debug("AgentGate warmup failed: %s", exc)
+            return False
+        return True
 
     # ── Public API ────────────────────────────────────────────────────
 
@@ -115,12 +409,12 @@ class AgentGateClient:
             body["params"] = params
         if context:
             body["context"] = context
-        body["urgency"] = urgency.value if isinstance(urgency, Urgency) else urgency
+        body["urgency"] = _URGENCY_VALUES.get(urgency, urgency)
         if expires_at:
             body["expiresAt"] = expires_at
 
         data = await self._request("POST", "/api/requests", json_data=body)
-        return ApprovalRequest.from_response(data)
+        return ApprovalRequest.from_response(data, include_raw=self._include_raw)
 
     async def check_decision(self, request_id: str) -> DecisionResult:
         """Check the decision status of an approval request.
@@ -137,21 +431,96 @@ class AgentGateClient:
         data = await self._request("GET", f"/api/requests/{request_id}")
         return DecisionResult.from_response(data)
 
-    async def list_policies(self) -> List[Policy]:
+    async def check_decisions(self, request_ids: List[str]) -> List[DecisionResult]:
+        """Check the decision status of several approval requests concurrently.
+
+        The API has no multi-id lookup, so this issues one request per id over
+        the shared connection pool, with at most ``max_concurrency`` in flight.
+
+        Args:
+            request_ids: The approval request IDs.
+
+        Returns:
+            DecisionResults in the same order as ``request_ids``.
+
+        Raises:
+            AgentGateError: On API or connectivity error for any of the IDs; the
+                remaining lookups are cancelled before it is raised.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def check(request_id: str) -> DecisionResult:
+            async with semaphore:
+                return await self.check_decision(request_id)
+
+        tasks = [asyncio.ensure_future(check(i)) for i in request_ids]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def list_policies(self, *, refresh: bool = False) -> List[Policy]:
         """List all policies.
 
+        Results are cached for ``policy_cache_ttl`` seconds. Once stale, the
+        list is revalidated with ``If-None-Match`` when the server sent an
+        ``ETag``; concurrent callers share a single refresh. Every call returns
+        its own copies, so callers may modify the policies they get back.
+
+        Args:
+            refresh: Bypass a fresh cache entry and revalidate with the server.
+
         Returns:
             List of Policy objects.
 
         Raises:
             AgentGateError: On API or connectivity error.
         """
-        data = await self._request("GET", "/api/policies")
+        ttl = self._policy_cache_ttl
+        if ttl <= 0:
+            return self._parse_policies(await self._request("GET", "/api/policies"))
+
+        cache = self._policy_cache
+        if not refresh and cache is not None and time.monotonic() - cache[0] < ttl:
+            return copy.deepcopy(cache[2])
+
+        loop = asyncio.get_running_loop()
+        lock = self._policy_locks.get(loop)
+        if lock is None:
+            lock = self._policy_locks[loop] = asyncio.Lock()
+        async with lock:
+            # Another task may have refreshed the cache while we waited.
+            if self._policy_cache is not cache and self._policy_cache is not None:
+                return copy.deepcopy(self._policy_cache[2])
+
+            etag = cache[1] if cache is not None else None
+            resp = await self._send(
+                "GET",
+                "/api/policies",
+                headers={"If-None-Match": etag} if etag else None,
+            )
+            if resp.status_code == 304 and cache is not None:
+                policies = cache[2]
+            else:
+                policies = self._parse_policies(_decode(resp))
+                etag = resp.headers.get("ETag")
+
+            self._policy_cache = (time.monotonic(), etag, policies)
+            return copy.deepcopy(policies)
+
+    def _parse_policies(self, data: Any) -> List[Policy]:
+        """Build Policy objects from a list-policies response body."""
+        # Some APIs wrap in {"policies": [...]} or {"data": [...]}
         if isinstance(data, list):
-            return [Policy.from_response(p) for p in data]
-        # Some APIs wrap in {"policies": [...]}
-        policies = data.get("policies", data.get("data", []))
-        return [Policy.from_response(p) for p in policies]
+            policies = data
+        else:
+            policies = data.get("policies") or data.get("data") or []
+        if self._include_raw:
+            return list(map(Policy.from_response, policies))
+        return [Policy.from_response(p, include_raw=False) for p in policies]
 
     async def request_approval_safe(
         self,
@@ -183,23 +552,16 @@ class AgentGateClient:
         context: Optional[Dict[str, Any]],
     ) -> ApprovalRequest:
         """Create a synthetic fallback ApprovalRequest."""
-        if self._fallback == FallbackBehavior.ALLOW:
-            status = "approved"
-            decision = "approved"
-        else:
-            status = "denied"
-            decision = "denied"
-
         logger.warning(
             "AgentGate unreachable — returning fallback %s for action=%s",
-            status,
+            self._fallback_status,
             action,
         )
         return ApprovalRequest(
             id="fallback",
             action=action,
-            status=status,
-            decision=decision,
+            status=self._fallback_status,
+            decision=self._fallback_decision,
             params=params or {},
             context=context or {},
             raw={"_fallback": True},
@@ -214,82 +576,122 @@ class AgentGateClient:
         *,
         json_data: Optional[Any] = None,
     ) -> Any:
-        """Make HTTP request with retry and error handling."""
-        last_exc: Optional[Exception] = None
-        backoffs = _RETRY_BACKOFFS[: self._max_retries]
-
-        for attempt in range(1 + len(backoffs)):
-            try:
-                resp = await self._http.request(method, path, json=json_data)
-
-                # Client errors: no retry
-                if resp.status_code in _CLIENT_ERROR_STATUS:
-                    data = resp.json()
-                    error_info = data.get("error", {}) if isinstance(data, dict) else {}
-                    raise AgentGateError(
-                        error_info.get("message", f"HTTP {resp.status_code}"),
-                        status_code=resp.status_code,
-                        error_type=error_info.get("type"),
-                        response_data=data,
-                    )
-
-                # Retryable server errors
-                if resp.status_code in _RETRYABLE_STATUS and attempt < len(backoffs):
-                    logger.warning(
-                        "AgentGate returned %d (attempt %d/%d), retrying in %.1fs",
-                        resp.status_code,
-                        attempt + 1,
-                        len(backoffs) + 1,
-                        backoffs[attempt],
-                    )
-                    await asyncio.sleep(backoffs[attempt])
-                    continue
+        """Make HTTP request with retry and error handling; return the decoded body."""
+        return _decode(await self._send(method, path, json_data=json_data))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Send a request with retries; raise AgentGateError on errors.
 
-                data = resp.json()
-
-                if resp.status_code >= 400:
-                    error_info = data.get("error", {}) if isinstance(data, dict) else {}
-                    raise AgentGateError(
-                        error_info.get("message", f"HTTP {resp.status_code}"),
-                        status_code=resp.status_code,
-                        error_type=error_info.get("type"),
-                        response_data=data,
-                    )
-
-                return data
-
-            except AgentGateError:
-                raise
-            except (httpx.ConnectError, httpx.TimeoutException, httpx.ConnectTimeout) as exc:
-                last_exc = exc
-                if attempt < len(backoffs):
-                    logger.warning(
-                        "AgentGate connection error (attempt %d/%d): %s, retrying in %.1fs",
-                        attempt + 1,
-                        len(backoffs) + 1,
-                        exc,
-                        backoffs[attempt],
-                    )
-                    await asyncio.sleep(backoffs[attempt])
+        Returns the raw response for any status below 400 (including 304).
+        """
+        backoffs = self._backoffs
+        attempts = len(backoffs) + 1
+        request = self._http.request
+        sleep = asyncio.sleep
+
+        try:
+            # Encode once up front; retries resend the same bytes. The client's
+            # default headers already carry Content-Type: application/json.
+            content = _dumps(json_data) if json_data is not None else None
+
+            for attempt in range(attempts):
+                try:
+                    resp = await request(method, path, content=content, headers=headers)
+                except (httpx.ConnectError, httpx.TimeoutException) as exc:
+                    if attempt < len(backoffs):
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                "AgentGate connection error (attempt %d/%d): %s, retrying in %.1fs",
+                                attempt + 1,
+                                attempts,
+                                exc,
+                                backoffs[attempt],
+                            )
+                        await sleep(backoffs[attempt])
+                        continue
+                    raise
+
+                status = resp.status_code
+
+                # Retryable server errors: retry without decoding the body
+                if status in _RETRYABLE_STATUS and attempt < len(backoffs):
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "AgentGate returned %d (attempt %d/%d), retrying in %.1fs",
+                            status,
+                            attempt + 1,
+                            attempts,
+                            backoffs[attempt],
+                        )
+                    await sleep(backoffs[attempt])
                     continue
-                raise AgentGateError(
-                    f"Connection failed: {exc}",
-                    is_connectivity_error=True,
-                ) from exc
-            except Exception as exc:
-                raise AgentGateError(
-                    f"Unexpected error: {exc}",
-                    is_connectivity_error=True,
-                ) from exc
-
-        if last_exc:
+
+                # Client errors (and server errors once retries run out): no retry
+                if status >= 400:
+                    try:
+                        data = _loads(resp.content)
+                    except ValueError:  # e.g. an HTML/text page from a proxy
+                        data = None
+                    raise _api_error(status, data)
+
+                return resp
+
+        except AgentGateError:
+            raise
+        # Connection failures and timeouts arrive here once retries run out.
+        except httpx.RequestError as exc:
             raise AgentGateError(
-                f"Connection failed after retries: {last_exc}",
+                f"Connection failed: {exc}",
                 is_connectivity_error=True,
-            ) from last_exc
+            ) from exc
+        # Unencodable bodies and malformed requests are client bugs, not
+        # outages: no fallback.
+        except (ValueError, TypeError) as exc:
+            raise AgentGateError(f"Unexpected error: {exc}") from exc
+
         raise RuntimeError("Retry loop exhausted unexpectedly")
 
 
+class _LoopThread:
+    """A daemon thread running one long-lived event loop.
+
+    The sync client submits every call to this loop so its HTTP connection
+    pool and keepalive connections survive between calls. The loop is a
+    uvloop loop when uvloop is installed; the global event loop policy is
+    left untouched.
+    """
+
+    def __init__(self) -> None:
+        self.loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="agentgate-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+
+_LOOP_THREAD: Optional[_LoopThread] = None
+_LOOP_THREAD_LOCK = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    """Return the process-wide background loop, starting it on first use."""
+    global _LOOP_THREAD
+    if _LOOP_THREAD is None:
+        with _LOOP_THREAD_LOCK:
+            if _LOOP_THREAD is None:
+                _LOOP_THREAD = _LoopThread()
+    return _LOOP_THREAD
+
+
 class AgentGateClientSync:
     """Synchronous wrapper around AgentGateClient.
 
@@ -299,10 +701,16 @@ class AgentGateClientSync:
         req = client.request_approval("deploy", params={"env": "prod"})
         result = client.check_decision(req.id)
         client.close()
+
+    Pass ``warmup=True`` to open a pooled connection during construction
+    (see :meth:`AgentGateClient.warmup`). Other keyword arguments are
+    forwarded to :class:`AgentGateClient`.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, *, warmup: bool = False, **kwargs: Any) -> None:
         self._async_client = AgentGateClient(**kwargs)
+        if warmup:
+            self.warmup()
 
     def __enter__(self) -> "AgentGateClientSync":
         return self
@@ -314,6 +722,10 @@ class AgentGateClientSync:
         """Close the underlying HTTP client."""
         self._run(self._async_client.close())
 
+    def warmup(self) -> bool:
+        """Open a pooled connection early. See :meth:`AgentGateClient.warmup`."""
+        return self._run(self._async_client.warmup())
+
     def request_approval(
         self,
         action: str,
@@ -350,21 +762,21 @@ class AgentGateClientSync:
         """Check decision status. See :meth:`AgentGateClient.check_decision`."""
         return self._run(self._async_client.check_decision(request_id))
 
-    def list_policies(self) -> List[Policy]:
+    def check_decisions(self, request_ids: List[str]) -> List[DecisionResult]:
+        """Check several decisions concurrently. See :meth:`AgentGateClient.check_decisions`."""
+        return self._run(self._async_client.check_decisions(request_ids))
+
+    def list_policies(self, *, refresh: bool = False) -> List[Policy]:
         """List policies. See :meth:`AgentGateClient.list_policies`."""
-        return self._run(self._async_client.list_policies())
+        return self._run(self._async_client.list_policies(refresh=refresh))
 
     @staticmethod
     def _run(coro: Any) -> Any:
-        """Run a coroutine, handling nested event loops."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                return pool.submit(asyncio.run, coro).result()
-        else:
-            return asyncio.run(coro)
+        """Run a coroutine on the shared background event loop and wait for it.
+
+        Calls are always routed to the background loop, even from a worker
+        thread of another running loop (e.g. a sync FastAPI endpoint): the
+        HTTP client's pooled connections belong to the loop that opened them,
+        so they must not be driven from the caller's loop.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, _get_loop_thread().loop).result()
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+).
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_DECIDED_STATUSES = frozenset(("approved", "denied", "expired"))
+
 
 class Decision(str, Enum):
     """Approval decision values."""
@@ -32,7 +38,14 @@ class FallbackBehavior(str, Enum):
     DENY = "deny"
 
 
-@dataclass
+class BackoffStrategy(str, Enum):
+    """Delay schedule between retries."""
+
+    JITTER = "jitter"
+    FIXED = "fixed"
+
+
+@dataclass(**_SLOTS)
 class ApprovalRequest:
     """An approval request returned by the API."""
 
@@ -51,25 +64,26 @@ class ApprovalRequest:
     raw: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_response(cls, data: Dict[str, Any]) -> "ApprovalRequest":
+    def from_response(cls, data: Dict[str, Any], include_raw: bool = True) -> "ApprovalRequest":
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            action=data.get("action", ""),
-            status=data.get("status", "pending"),
-            decision=data.get("decision"),
-            params=data.get("params", {}),
-            context=data.get("context", {}),
-            urgency=data.get("urgency", "normal"),
-            decided_by=data.get("decidedBy"),
-            decided_at=data.get("decidedAt"),
-            expires_at=data.get("expiresAt"),
-            created_at=data.get("createdAt"),
-            updated_at=data.get("updatedAt"),
-            raw=data,
+            id=get("id", ""),
+            action=get("action", ""),
+            status=get("status", "pending"),
+            decision=get("decision"),
+            params=get("params", {}),
+            context=get("context", {}),
+            urgency=get("urgency", "normal"),
+            decided_by=get("decidedBy"),
+            decided_at=get("decidedAt"),
+            expires_at=get("expiresAt"),
+            created_at=get("createdAt"),
+            updated_at=get("updatedAt"),
+            raw=data if include_raw else {},
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Policy:
     """A policy returned by the API."""
 
@@ -81,18 +95,19 @@ class Policy:
     raw: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_response(cls, data: Dict[str, Any]) -> "Policy":
+    def from_response(cls, data: Dict[str, Any], include_raw: bool = True) -> "Policy":
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            rules=data.get("rules", []),
-            priority=data.get("priority", 0),
-            enabled=data.get("enabled", True),
-            raw=data,
+            id=get("id", ""),
+            name=get("name", ""),
+            rules=get("rules", []),
+            priority=get("priority", 0),
+            enabled=get("enabled", True),
+            raw=data if include_raw else {},
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DecisionResult:
     """Result of checking a decision."""
 
@@ -103,11 +118,11 @@ class DecisionResult:
 
     @classmethod
     def from_response(cls, data: Dict[str, Any]) -> "DecisionResult":
-        status = data.get("status", "pending")
-        decision = data.get("decision")
+        get = data.get
+        status = get("status", "pending")
         return cls(
-            id=data.get("id", ""),
+            id=get("id", ""),
             status=status,
-            decision=decision,
-            is_decided=status in ("approved", "denied", "expired"),
+            decision=get("decision"),
+            is_decided=status in _DECIDED_STATUSES,
         )
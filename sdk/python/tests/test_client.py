@@ -2,6 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
+import sys
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List, Tuple
+
+import httpcore
 import httpx
 import pytest
 import respx
@@ -10,8 +20,14 @@ from agentgate import (
     AgentGateClient,
     AgentGateClientSync,
     AgentGateError,
+    ApprovalRequest,
+    DecisionResult,
     FallbackBehavior,
+    Policy,
+    Urgency,
 )
+import agentgate.client
+from agentgate.client import clear_env_cache
 
 
 BASE_URL = "http://localhost:3000"
@@ -43,6 +59,9 @@ class TestRequestApproval:
         )
 
         req = await client.request_approval("deploy", params={"env": "prod"})
+        sent = json.loads(respx.calls.last.request.content)
+        assert sent == {"action": "deploy", "params": {"env": "prod"}, "urgency": "normal"}
+        assert respx.calls.last.request.headers["Content-Type"] == "application/json"
         assert req.id == "req_123"
         assert req.action == "deploy"
         assert req.status == "pending"
@@ -66,9 +85,44 @@ class TestRequestApproval:
         )
 
         req = await client.request_approval("read_file", urgency="low")
+        assert json.loads(respx.calls.last.request.content)["urgency"] == "low"
         assert req.status == "approved"
         assert req.decision == "approved"
 
+    @pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+    @respx.mock
+    async def test_non_str_keys_encoded(
+        self, client: AgentGateClient, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        if backend == "stdlib":
+            monkeypatch.setattr("agentgate.client.orjson", None)
+        elif agentgate.client.orjson is None:
+            pytest.skip("orjson not installed")
+        respx.post(f"{BASE_URL}/api/requests").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "deploy", "status": "pending"})
+        )
+
+        await client.request_approval("deploy", params={1: "x"})
+        assert json.loads(respx.calls.last.request.content)["params"] == {"1": "x"}
+
+    @respx.mock
+    async def test_unencodable_body(self, client: AgentGateClient) -> None:
+        route = respx.post(f"{BASE_URL}/api/requests")
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.request_approval("deploy", params={"obj": object()})
+        assert exc_info.value.is_connectivity_error is False
+        assert route.call_count == 0
+
+    @respx.mock
+    async def test_urgency_enum(self, client: AgentGateClient) -> None:
+        respx.post(f"{BASE_URL}/api/requests").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "deploy", "status": "pending"})
+        )
+
+        await client.request_approval("deploy", urgency=Urgency.CRITICAL)
+        assert json.loads(respx.calls.last.request.content)["urgency"] == "critical"
+
 
 class TestCheckDecision:
     @respx.mock
@@ -103,6 +157,45 @@ class TestCheckDecision:
         assert result.decision == "approved"
         assert result.is_decided is True
 
+    @respx.mock
+    async def test_check_decisions(self) -> None:
+        client = AgentGateClient(url=BASE_URL, max_concurrency=2)
+        for i, status in enumerate(("pending", "approved", "denied")):
+            respx.get(f"{BASE_URL}/api/requests/req_{i}").mock(
+                return_value=httpx.Response(200, json={"id": f"req_{i}", "action": "x", "status": status})
+            )
+
+        results = await client.check_decisions(["req_2", "req_0", "req_1"])
+        assert [r.id for r in results] == ["req_2", "req_0", "req_1"]
+        assert [r.is_decided for r in results] == [True, False, True]
+
+    @respx.mock
+    async def test_check_decisions_cancels_on_error(self) -> None:
+        client = AgentGateClient(url=BASE_URL, max_retries=0)
+        cancelled: List[str] = []
+
+        def slow(request_id: str) -> Any:
+            async def handler(request: httpx.Request) -> httpx.Response:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(request_id)
+                    raise
+                return httpx.Response(200, json={"id": request_id, "action": "x", "status": "pending"})
+
+            return handler
+
+        respx.get(f"{BASE_URL}/api/requests/req_0").mock(side_effect=slow("req_0"))
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(404, json={"error": "Not found"})
+        )
+        respx.get(f"{BASE_URL}/api/requests/req_2").mock(side_effect=slow("req_2"))
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.check_decisions(["req_0", "req_1", "req_2"])
+        assert exc_info.value.status_code == 404
+        assert sorted(cancelled) == ["req_0", "req_2"]
+
 
 class TestListPolicies:
     @respx.mock
@@ -121,6 +214,128 @@ class TestListPolicies:
         assert len(policies) == 2
         assert policies[0].name == "Auto-approve reads"
 
+    @respx.mock
+    async def test_list_wrapped(self, client: AgentGateClient) -> None:
+        respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(
+                200,
+                json={"policies": [{"id": "pol_1", "name": "Wrapped", "priority": 3}]},
+            )
+        )
+
+        policies = await client.list_policies()
+        assert [p.id for p in policies] == ["pol_1"]
+        assert policies[0].priority == 3
+
+
+class TestPolicyCache:
+    @respx.mock
+    async def test_cached_within_ttl(self, client: AgentGateClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(200, json=[{"id": "pol_1", "name": "P"}])
+        )
+
+        first = await client.list_policies()
+        second = await client.list_policies()
+        assert [p.id for p in second] == ["pol_1"]
+        assert first is not second
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_cached_policies_are_copies(self, client: AgentGateClient) -> None:
+        respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(
+                200, json=[{"id": "pol_1", "name": "P", "rules": [{"action": "deploy"}], "enabled": True}]
+            )
+        )
+
+        first = await client.list_policies()
+        first[0].rules.append({"action": "delete"})
+        first[0].enabled = False
+        first[0].raw["name"] = "changed"
+
+        second = await client.list_policies()
+        assert second[0].rules == [{"action": "deploy"}]
+        assert second[0].enabled is True
+        assert second[0].raw["name"] == "P"
+
+    @respx.mock
+    async def test_cache_disabled(self) -> None:
+        client = AgentGateClient(url=BASE_URL, policy_cache_ttl=0)
+        route = respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(200, json=[{"id": "pol_1", "name": "P"}])
+        )
+
+        await client.list_policies()
+        await client.list_policies()
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_revalidates_with_etag(self, client: AgentGateClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/policies")
+        route.side_effect = [
+            httpx.Response(200, json=[{"id": "pol_1", "name": "P"}], headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        await client.list_policies()
+        policies = await client.list_policies(refresh=True)
+        assert [p.id for p in policies] == ["pol_1"]
+        assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_concurrent_misses_collapse(self, client: AgentGateClient) -> None:
+        route = respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(200, json=[{"id": "pol_1", "name": "P"}])
+        )
+
+        results = await asyncio.gather(*(client.list_policies() for _ in range(5)))
+        assert all(len(r) == 1 for r in results)
+        assert route.call_count == 1
+
+
+class TestTypes:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need Python 3.10+")
+    def test_slotted(self) -> None:
+        for obj in (
+            ApprovalRequest.from_response({"id": "r"}),
+            Policy.from_response({"id": "p"}),
+            DecisionResult.from_response({"id": "d"}),
+        ):
+            assert not hasattr(obj, "__dict__")
+
+    @respx.mock
+    async def test_include_raw_disabled(self) -> None:
+        client = AgentGateClient(url=BASE_URL, include_raw=False)
+        respx.post(f"{BASE_URL}/api/requests").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "deploy", "status": "pending"})
+        )
+        respx.get(f"{BASE_URL}/api/policies").mock(
+            return_value=httpx.Response(200, json=[{"id": "pol_1", "name": "P"}])
+        )
+
+        req = await client.request_approval("deploy")
+        policies = await client.list_policies()
+        assert req.id == "req_1"
+        assert req.raw == {}
+        assert policies[0].raw == {}
+
+    def test_include_raw_default(self) -> None:
+        data = {"id": "pol_1", "name": "P"}
+        assert Policy.from_response(data).raw is data
+
+    def test_include_raw_unset_warns(self) -> None:
+        with pytest.warns(FutureWarning, match="include_raw"):
+            client = AgentGateClient(url=BASE_URL)
+        assert client._include_raw is True
+
+    def test_include_raw_explicit_does_not_warn(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            AgentGateClient(url=BASE_URL, include_raw=True)
+            AgentGateClient(url=BASE_URL, include_raw=False)
+
 
 class TestRetry:
     @respx.mock
@@ -155,6 +370,93 @@ class TestRetry:
             await client.request_approval("deploy")
         assert exc_info.value.status_code == 403
 
+    def test_fixed_backoff_schedule(self) -> None:
+        client = AgentGateClient(url=BASE_URL, max_retries=5, backoff_strategy="fixed")
+        assert client._backoffs == (0.5, 1.0, 2.0, 4.0, 8.0)
+
+    def test_jitter_backoff_schedule(self) -> None:
+        client = AgentGateClient(url=BASE_URL, max_retries=6)
+        assert len(client._backoffs) == 6
+        for delay, base in zip(client._backoffs, (0.5, 1.0, 2.0, 4.0, 8.0, 8.0)):
+            assert base * 0.5 <= delay < base * 1.5
+
+    @respx.mock
+    async def test_server_error_with_string_error_body(self) -> None:
+        client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=0)
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(500, json={"error": "internal"})
+        )
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.check_decision("req_1")
+        assert exc_info.value.status_code == 500
+        assert str(exc_info.value) == "HTTP 500"
+        assert exc_info.value.is_connectivity_error is False
+
+    @respx.mock
+    async def test_error_status_with_non_json_body(self) -> None:
+        client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=0)
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(502, content=b"<html>Bad Gateway</html>")
+        )
+        respx.get(f"{BASE_URL}/api/requests/req_2").mock(
+            return_value=httpx.Response(401, content=b"Unauthorized")
+        )
+
+        for request_id, status in (("req_1", 502), ("req_2", 401)):
+            with pytest.raises(AgentGateError) as exc_info:
+                await client.check_decision(request_id)
+            assert str(exc_info.value) == f"HTTP {status}"
+            assert exc_info.value.status_code == status
+            assert exc_info.value.response_data is None
+
+    @respx.mock
+    async def test_invalid_utf8_body_with_stdlib_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("agentgate.client._loads", json.loads)
+        client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=0)
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(200, content=b"\x80garbage")
+        )
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.check_decision("req_1")
+        assert exc_info.value.status_code == 200
+        assert exc_info.value.is_connectivity_error is False
+
+    @respx.mock
+    async def test_retry_on_timeout(self) -> None:
+        client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=1)
+        route = respx.get(f"{BASE_URL}/api/requests/req_1")
+        route.side_effect = [
+            httpx.ReadTimeout("slow"),
+            httpx.Response(200, json={"id": "req_1", "action": "x", "status": "pending"}),
+        ]
+
+        result = await client.check_decision("req_1")
+        assert result.id == "req_1"
+        assert route.call_count == 2
+
+    async def test_connect_attempts_bounded_by_max_retries(self) -> None:
+        class TimeoutBackend(httpcore.AsyncNetworkBackend):
+            attempts = 0
+
+            async def connect_tcp(self, *args: Any, **kwargs: Any) -> httpcore.AsyncNetworkStream:
+                TimeoutBackend.attempts += 1
+                raise httpcore.ConnectTimeout("timed out")
+
+            async def sleep(self, seconds: float) -> None:
+                pass
+
+        client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=3)
+        client._http._transport._pool._network_backend = TimeoutBackend()
+        client._backoffs = (0.0, 0.0, 0.0)
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.check_decision("req_1")
+        assert exc_info.value.is_connectivity_error is True
+        # One initial attempt plus three retries, nothing more.
+        assert TimeoutBackend.attempts == 4
+
     @respx.mock
     async def test_retry_on_connection_error(self) -> None:
         client = AgentGateClient(url=BASE_URL, api_key="test", max_retries=1)
@@ -168,6 +470,16 @@ class TestRetry:
         assert result.id == "req_1"
         assert route.call_count == 2
 
+    def test_env_proxy_mounted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy", "HTTP_PROXY", "http_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+
+        client = AgentGateClient(url="https://agentgate.example.com")
+        mounts = {pattern.pattern: transport for pattern, transport in client._http._mounts.items()}
+        assert set(mounts) == {"https://"}
+        assert isinstance(mounts["https://"]._pool, httpcore.AsyncHTTPProxy)
+
 
 class TestGracefulDegradation:
     @respx.mock
@@ -179,6 +491,28 @@ class TestGracefulDegradation:
         assert req.id == "fallback"
         assert req.status == "denied"
         assert req.decision == "denied"
+        assert req.params == {}
+        assert req.raw == {"_fallback": True}
+
+    @respx.mock
+    async def test_fallback_keeps_params(self) -> None:
+        client = AgentGateClient(url=BASE_URL, fallback="deny", max_retries=0)
+        respx.post(f"{BASE_URL}/api/requests").mock(side_effect=httpx.ConnectError("refused"))
+
+        req = await client.request_approval_safe("deploy", params={"env": "prod"})
+        assert req.params == {"env": "prod"}
+        assert req.context == {}
+
+    @respx.mock
+    async def test_fallback_is_serializable(self) -> None:
+        client = AgentGateClient(url=BASE_URL, fallback="deny", max_retries=0)
+        respx.post(f"{BASE_URL}/api/requests").mock(side_effect=httpx.ConnectError("refused"))
+
+        req = await client.request_approval_safe("deploy")
+        assert dataclasses.asdict(req)["raw"] == {"_fallback": True}
+        assert json.loads(json.dumps(req.raw)) == {"_fallback": True}
+        req.params["note"] = "audited"
+        assert req.params == {"note": "audited"}
 
     @respx.mock
     async def test_fallback_allow(self) -> None:
@@ -190,6 +524,18 @@ class TestGracefulDegradation:
         assert req.status == "approved"
         assert req.decision == "approved"
 
+    @respx.mock
+    async def test_fallback_not_used_on_invalid_json(self) -> None:
+        client = AgentGateClient(url=BASE_URL, fallback="allow", max_retries=0)
+        respx.post(f"{BASE_URL}/api/requests").mock(
+            return_value=httpx.Response(200, content=b"<html>oops</html>")
+        )
+
+        with pytest.raises(AgentGateError) as exc_info:
+            await client.request_approval_safe("deploy")
+        assert exc_info.value.status_code == 200
+        assert exc_info.value.is_connectivity_error is False
+
     @respx.mock
     async def test_fallback_not_used_on_client_error(self) -> None:
         client = AgentGateClient(url=BASE_URL, fallback="allow", max_retries=0)
@@ -202,7 +548,45 @@ class TestGracefulDegradation:
         assert exc_info.value.status_code == 401
 
 
+class TestFallbackOption:
+    def test_invalid_fallback_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            AgentGateClient(url=BASE_URL, fallback="maybe")
+
+    def test_enum_fallback(self) -> None:
+        client = AgentGateClient(url=BASE_URL, fallback=FallbackBehavior.ALLOW)
+        assert client._fallback is FallbackBehavior.ALLOW
+
+
+class TestWarmup:
+    @respx.mock
+    async def test_warmup(self, client: AgentGateClient) -> None:
+        route = respx.get(f"{BASE_URL}/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+
+        assert await client.warmup() is True
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_warmup_swallows_errors(self, client: AgentGateClient) -> None:
+        respx.get(f"{BASE_URL}/health").mock(side_effect=httpx.ConnectError("refused"))
+
+        assert await client.warmup() is False
+
+    @respx.mock
+    def test_sync_warmup_on_init(self) -> None:
+        route = respx.get(f"{BASE_URL}/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+
+        with AgentGateClientSync(url=BASE_URL, warmup=True):
+            assert route.call_count == 1
+
+
 class TestEnvVars:
+    @pytest.fixture(autouse=True)
+    def _fresh_env_cache(self) -> Iterator[None]:
+        clear_env_cache()
+        yield
+        clear_env_cache()
+
     def test_env_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("AGENTGATE_URL", "http://custom:9999")
         monkeypatch.setenv("AGENTGATE_API_KEY", "env-key")
@@ -213,6 +597,147 @@ class TestEnvVars:
         assert client._api_key == "env-key"
         assert client._timeout == 30.0
 
+    def test_env_cached_until_cleared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTGATE_URL", "http://first:1")
+        assert AgentGateClient()._url == "http://first:1"
+
+        monkeypatch.setenv("AGENTGATE_URL", "http://second:2")
+        assert AgentGateClient()._url == "http://first:1"
+
+        clear_env_cache()
+        assert AgentGateClient()._url == "http://second:2"
+
+    def test_explicit_args_override_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTGATE_URL", "http://custom:9999")
+        monkeypatch.setenv("AGENTGATE_TIMEOUT", "30")
+
+        client = AgentGateClient(url="http://explicit:1/", timeout=5)
+        assert client._url == "http://explicit:1"
+        assert client._timeout == 5.0
+
+
+class TestConnectionPool:
+    def test_pool_options(self) -> None:
+        client = AgentGateClient(
+            url=BASE_URL,
+            max_connections=5,
+            max_keepalive_connections=2,
+            keepalive_expiry=1.0,
+            http2=False,
+        )
+        pool = client._http._transport._pool
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 2
+        assert pool._keepalive_expiry == 1.0
+        assert pool._http2 is False
+
+    def test_http2_default(self) -> None:
+        client = AgentGateClient(url=BASE_URL)
+        assert client._http._transport._pool._http2 is True
+
+
+@pytest.fixture
+def live_server() -> Iterator[str]:
+    """A real keep-alive HTTP server, so pooled connections are actually reused."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path == "/api/policies":
+                payload: Any = [{"id": "pol_1", "name": "P", "rules": [{"action": "deploy"}]}]
+            else:
+                payload = {"id": self.path.rsplit("/", 1)[-1], "action": "x", "status": "pending"}
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedClient:
+    async def test_reuses_http_client(self) -> None:
+        a = AgentGateClient.shared(url=BASE_URL, api_key="shared-key")
+        b = AgentGateClient.shared(url=BASE_URL, api_key="shared-key")
+        assert a is not b
+        assert a._http is b._http
+
+    async def test_keyed_by_config(self) -> None:
+        a = AgentGateClient.shared(url=BASE_URL, api_key="key-a")
+        b = AgentGateClient.shared(url=BASE_URL, api_key="key-b")
+        assert a._http is not b._http
+
+    @respx.mock
+    async def test_max_retries_per_client(self) -> None:
+        route = respx.get(f"{BASE_URL}/api/requests/req_1").mock(side_effect=httpx.ConnectError("refused"))
+
+        for max_retries, calls in ((2, 3), (0, 1)):
+            client = AgentGateClient.shared(url=BASE_URL, api_key="shared-retries", max_retries=max_retries)
+            client._backoffs = (0.0,) * max_retries
+            route.reset()
+            with pytest.raises(AgentGateError):
+                await client.check_decision("req_1")
+            assert route.call_count == calls
+
+    def test_separate_event_loops(self, live_server: str) -> None:
+        async def main() -> Tuple[str, httpx.AsyncClient]:
+            client = AgentGateClient.shared(url=live_server, api_key="two-loops")
+            result = await client.check_decision("req_1")
+            return result.id, client._http
+
+        first_id, first_http = asyncio.run(main())
+        second_id, second_http = asyncio.run(main())
+        assert first_id == second_id == "req_1"
+        assert first_http is not second_http
+
+    def test_policy_refresh_across_event_loops(self, live_server: str) -> None:
+        client = AgentGateClient.shared(url=live_server, api_key="policy-loops")
+
+        async def main() -> List[List[Policy]]:
+            return list(await asyncio.gather(*(client.list_policies(refresh=True) for _ in range(2))))
+
+        for _ in range(2):
+            results = asyncio.run(main())
+            assert [[p.id for p in r] for r in results] == [["pol_1"], ["pol_1"]]
+
+    def test_close_at_exit_on_background_loop(self, live_server: str) -> None:
+        from agentgate.client import _close_shared_clients, _get_loop_thread
+
+        async def main() -> httpx.AsyncClient:
+            client = AgentGateClient.shared(url=live_server, api_key="at-exit")
+            await client.check_decision("req_1")
+            return client._http
+
+        loop = _get_loop_thread().loop
+        http = asyncio.run_coroutine_threadsafe(main(), loop).result()
+        _close_shared_clients()
+        assert http.is_closed is True
+
+    @respx.mock
+    async def test_close_keeps_shared_pool_open(self) -> None:
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "x", "status": "pending"})
+        )
+
+        async with AgentGateClient.shared(url=BASE_URL, api_key="shared-close") as client:
+            await client.check_decision("req_1")
+        assert client._http.is_closed is False
+
+        again = AgentGateClient.shared(url=BASE_URL, api_key="shared-close")
+        result = await again.check_decision("req_1")
+        assert result.id == "req_1"
+
 
 # ── Sync client tests ─────────────────────────────────────────────────
 
@@ -271,3 +796,33 @@ class TestSyncClient:
         with AgentGateClientSync(url=BASE_URL, fallback="allow", max_retries=0) as client:
             req = client.request_approval_safe("deploy")
             assert req.status == "approved"
+
+    @respx.mock
+    async def test_inside_running_loop(self) -> None:
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "x", "status": "pending"})
+        )
+
+        with AgentGateClientSync(url=BASE_URL, api_key="test") as client:
+            assert client.check_decision("req_1").id == "req_1"
+            assert client.check_decision("req_1").id == "req_1"
+
+    @respx.mock
+    async def test_from_worker_thread_of_running_loop(self) -> None:
+        respx.get(f"{BASE_URL}/api/requests/req_1").mock(
+            return_value=httpx.Response(200, json={"id": "req_1", "action": "x", "status": "pending"})
+        )
+
+        with AgentGateClientSync(url=BASE_URL, api_key="test") as client:
+            result = await asyncio.to_thread(client.check_decision, "req_1")
+            assert result.id == "req_1"
+            assert client.check_decision("req_1").id == "req_1"
+
+    def test_reuses_background_loop(self) -> None:
+        from agentgate.client import _get_loop_thread
+
+        loop = _get_loop_thread().loop
+        with AgentGateClientSync(url=BASE_URL, api_key="test"):
+            pass
+        assert _get_loop_thread().loop is loop
+        assert loop.is_running()